@@ -6,16 +6,17 @@ Common utilities used across ad-copy-analyzer and facebook-ads-intelligence comp
 to eliminate code duplication and improve maintainability.
 """
 
-from .text_processing import TextProcessor, clean_text, extract_features
+from .text_processing import TextProcessor, clean_text, extract_features, extract_features_batch
 from .config_management import ConfigManager, load_config, get_env_var
 from .http_server import CustomHTTPServer, create_cors_handler
-from .file_utils import safe_json_load, safe_json_save, ensure_directory
+from .file_utils import safe_json_load, safe_json_save, ensure_directory, iter_json_items
 
 __version__ = "1.0.0"
 __all__ = [
     'TextProcessor',
     'clean_text', 
     'extract_features',
+    'extract_features_batch',
     'ConfigManager',
     'load_config',
     'get_env_var',
@@ -23,5 +24,6 @@ __all__ = [
     'create_cors_handler',
     'safe_json_load',
     'safe_json_save',
-    'ensure_directory'
+    'ensure_directory',
+    'iter_json_items'
 ]
\ No newline at end of file
@@ -6,12 +6,86 @@ Common configuration loading and environment variable handling
 to eliminate duplication across components.
 """
 
+import copy
 import os
+import sys
 import json
 import yaml
-from typing import Dict, Any, Optional, Union
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+_TRUTHY = frozenset({'true', '1', 'yes', 'on', 'y', 't'})
+_CONVERTERS = {
+    bool: lambda value: value.lower() in _TRUTHY,
+    int: int,
+    float: float,
+    str: str,
+}
+
+
+def _is_yaml(path_str: str) -> bool:
+    """Check whether a config path has a YAML extension."""
+    return os.path.splitext(path_str)[1].lower() in ['.yml', '.yaml']
+
+
+def _parse_config(path_str: str, data: bytes) -> Dict[str, Any]:
+    """
+    Parse configuration file contents based on the file extension.
+    
+    Args:
+        path_str: Path to the config file (used for its extension)
+        data: Raw file contents
+        
+    Returns:
+        Configuration dictionary
+    """
+    suffix = os.path.splitext(path_str)[1].lower()
+    if suffix in ['.yml', '.yaml']:
+        config = yaml.load(data, Loader=_YamlLoader) or {}
+    elif suffix == '.json':
+        config = json.loads(data)
+    else:
+        return {}
+    
+    # Intern top-level keys so repeated lookups can compare by identity
+    if isinstance(config, dict):
+        config = {sys.intern(k) if isinstance(k, str) else k: v
+                  for k, v in config.items()}
+    return config
+
+
+def _load_file(path_str: str) -> Dict[str, Any]:
+    """Read and parse a configuration file without caching."""
+    with open(path_str, 'rb') as f:
+        return _parse_config(path_str, f.read())
+
+
+# Both caches are keyed on the resolved path and modification time, so an
+# edited file is transparently re-read on the next lookup.
+
+@lru_cache(maxsize=128)
+def _read_cached(path_str: str, mtime_ns: int) -> bytes:
+    """Return the raw contents of a config file (JSON is cheap to re-parse)."""
+    with open(path_str, 'rb') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Return a parsed YAML config.
+    
+    The result is shared process-wide and must not be mutated; load_config
+    hands out deep copies, which are still far cheaper than re-parsing YAML.
+    """
+    return _load_file(path_str)
+
 
 class ConfigManager:
     """Shared configuration management for all components."""
@@ -24,7 +98,6 @@ class ConfigManager:
             config_dir: Directory containing configuration files
         """
         self.config_dir = Path(config_dir) if config_dir else Path.cwd()
-        self._config_cache = {}
     
     def load_config(self, 
                    config_name: str,
@@ -33,6 +106,10 @@ class ConfigManager:
         """
         Load configuration from file with caching.
         
+        Cached entries are keyed on the file's path and modification time,
+        so changes on disk are picked up automatically. Each call returns
+        its own copy, so callers may modify the result freely.
+        
         Args:
             config_name: Name of config file (with or without extension)
             config_type: Type of config ('json', 'yaml', or 'auto')
@@ -41,37 +118,32 @@ class ConfigManager:
         Returns:
             Configuration dictionary
         """
-        cache_key = f"{config_name}_{config_type}"
-        
-        if use_cache and cache_key in self._config_cache:
-            return self._config_cache[cache_key]
-        
         # Find config file
         config_path = self._find_config_file(config_name, config_type)
         if not config_path:
             return {}
         
-        # Load based on file type
         try:
-            if config_path.suffix.lower() in ['.yml', '.yaml']:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f) or {}
-            elif config_path.suffix.lower() == '.json':
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            else:
-                config = {}
+            path_str = str(config_path.resolve())
+            if not use_cache:
+                return _load_file(path_str)
             
-            # Cache the result
-            if use_cache:
-                self._config_cache[cache_key] = config
-            
-            return config
+            # Every call gets its own dict, so callers may modify it freely
+            mtime_ns = os.stat(path_str).st_mtime_ns
+            if _is_yaml(path_str):
+                return copy.deepcopy(_load_yaml_cached(path_str, mtime_ns))
+            return _parse_config(path_str, _read_cached(path_str, mtime_ns))
             
         except Exception as e:
             print(f"Warning: Failed to load config {config_path}: {e}")
             return {}
     
+    @staticmethod
+    def invalidate_cache():
+        """Clear all cached configuration files."""
+        _read_cached.cache_clear()
+        _load_yaml_cached.cache_clear()
+    
     def _find_config_file(self, config_name: str, config_type: str) -> Optional[Path]:
         """
         Find configuration file with various extensions.
@@ -129,14 +201,7 @@ class ConfigManager:
         
         # Type conversion
         try:
-            if var_type == bool:
-                return value.lower() in ('true', '1', 'yes', 'on')
-            elif var_type == int:
-                return int(value)
-            elif var_type == float:
-                return float(value)
-            else:
-                return str(value)
+            return _CONVERTERS.get(var_type, str)(value)
         except (ValueError, TypeError):
             if required:
                 raise ValueError(f"Environment variable '{var_name}' cannot be converted to {var_type.__name__}")
@@ -6,15 +6,212 @@ Common file handling functions to eliminate duplication
 and provide consistent file operations across components.
 """
 
+import enum
+import fnmatch
 import json
+import math
 import os
+import re
+import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Encode the extra types orjson always serializes, and reject the rest.
+    
+    orjson has no option to refuse UUID and Enum values, so the stdlib path
+    encodes them the same way to keep output independent of orjson.
+    """
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def _json_dumps(data: Any, indent: Optional[int]) -> bytes:
+    separators = (',', ':') if indent is None else None
+    return json.dumps(data, indent=indent, separators=separators,
+                      ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data contains a NaN or infinite float anywhere."""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return False
+
+
+try:
+    import orjson
+
+    # orjson reads integers outside [-2**63, 2**64) as floats; json keeps
+    # them exact. Negative ones such as -9223372036854775809 have only 19
+    # digits, and over-matching merely costs a fallback parse.
+    _LONG_DIGITS_RE = re.compile(r'\d{19,}')
+    _LONG_DIGITS_BYTES_RE = re.compile(rb'\d{19,}')
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        pattern = _LONG_DIGITS_RE if isinstance(data, str) else _LONG_DIGITS_BYTES_RE
+        if pattern.search(data):
+            return _json_loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json reads and writes
+            return _json_loads(data)
+
+    # Route datetimes and dataclasses to _json_default, which rejects them
+    # like json does. Non-str keys raise too, so json applies its own rules.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def _dumps(data: Any, indent: Optional[int]) -> bytes:
+        # orjson can only indent by 2 spaces
+        if indent not in (None, 2):
+            return _json_dumps(data, indent)
+        option = _ORJSON_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            payload = orjson.dumps(data, default=_json_default, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits or non-str keys, which json handles
+            return _json_dumps(data, indent)
+        # orjson writes NaN/Infinity as null; keep them the way json does
+        if b'null' in payload and _has_non_finite(data):
+            return _json_dumps(data, indent)
+        return payload
+
+except ImportError:
+    _loads = _json_loads
+    _dumps = _json_dumps
+
+
+_DEFAULT_MARKERS = ('.git', 'pyproject.toml', 'setup.py', 'package.json', 'requirements.txt')
+
+# Directories already created or confirmed by this process
+_ENSURED_DIRS = set()
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Check whether an encoding name refers to UTF-8."""
+    return encoding.lower().replace('-', '').replace('_', '') == 'utf8'
+
+
+def _make_dirs(dir_path: Path) -> None:
+    """Create a directory tree, skipping the syscalls if already done."""
+    key = os.path.abspath(dir_path)
+    if key not in _ENSURED_DIRS:
+        dir_path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+
+def _write_into(dest: Path, write: Callable[[], Any], ensure_dir: bool = True) -> None:
+    """
+    Run a write to dest, creating its parent directory first if requested.
+    
+    If a cached parent directory was deleted in the meantime, the cache
+    entry is dropped, the directory recreated and the write retried once.
+    """
+    if not ensure_dir:
+        write()
+        return
+    
+    _make_dirs(dest.parent)
+    try:
+        write()
+    except FileNotFoundError:
+        _ENSURED_DIRS.discard(os.path.abspath(dest.parent))
+        _make_dirs(dest.parent)
+        write()
+
+
+def _select_items(data: Any, items_path: str) -> List[Any]:
+    """Select objects from parsed JSON using an ijson-style prefix."""
+    items = [data]
+    for part in items_path.split('.') if items_path else []:
+        selected = []
+        for obj in items:
+            if part == 'item' and isinstance(obj, list):
+                selected.extend(obj)
+            elif isinstance(obj, dict) and part in obj:
+                selected.append(obj[part])
+        items = selected
+    return items
+
+
+def _read_json(file_path: Union[str, Path], encoding: str) -> Any:
+    """Read and parse a whole JSON file."""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if not _is_utf8(encoding):
+        data = data.decode(encoding)
+    return _loads(data)
+
+
+def iter_json_items(file_path: Union[str, Path],
+                    items_path: str,
+                    encoding: str = 'utf-8') -> Iterator[Any]:
+    """
+    Lazily yield the objects under items_path from a JSON file.
+    
+    With ijson installed, UTF-8 files are parsed incrementally, so only the
+    object currently being yielded is held in memory. Without ijson, or for
+    other encodings, the whole document is parsed first and the matches are
+    yielded from it.
+    
+    ijson cannot parse NaN/Infinity literals or integers outside the 64-bit
+    range, both of which safe_json_save may write. Streaming such a file
+    raises json.JSONDecodeError; safe_json_load(items_path=...) reads them.
+    
+    Args:
+        file_path: Path to JSON file
+        items_path: ijson prefix of the objects to yield (e.g. "ads.item")
+        encoding: File encoding
+        
+    Yields:
+        Each matching JSON object
+        
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON or not streamable
+    """
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+    
+    if ijson is None or not _is_utf8(encoding):
+        yield from _select_items(_read_json(file_path, encoding), items_path)
+        return
+    
+    with open(file_path, 'rb') as f:
+        try:
+            yield from ijson.items(f, items_path, use_float=True)
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(
+                f"ijson failed ({e}); NaN/Infinity and integers beyond 64 bits "
+                f"cannot be streamed", '', 0) from e
 
 
 def safe_json_load(file_path: Union[str, Path], 
                   default: Any = None,
-                  encoding: str = 'utf-8') -> Any:
+                  encoding: str = 'utf-8',
+                  items_path: Optional[str] = None) -> Any:
     """
     Safely load JSON file with error handling.
     
@@ -22,24 +219,32 @@ def safe_json_load(file_path: Union[str, Path],
         file_path: Path to JSON file
         default: Default value if file doesn't exist or is invalid
         encoding: File encoding
+        items_path: ijson prefix (e.g. "ads.item") selecting the objects to
+            return; all matches are collected into a list, so use
+            iter_json_items to process them one at a time
         
     Returns:
-        Parsed JSON data or default value
+        Parsed JSON data (a list of matches if items_path is set) or default value
     """
     try:
-        with open(file_path, 'r', encoding=encoding) as f:
-            return json.load(f)
+        if items_path is None:
+            return _read_json(file_path, encoding)
+        try:
+            return list(iter_json_items(file_path, items_path, encoding))
+        except json.JSONDecodeError:
+            # Files ijson can't stream (NaN, huge integers) still parse whole
+            return _select_items(_read_json(file_path, encoding), items_path)
     except (FileNotFoundError, json.JSONDecodeError, IOError) as e:
         if default is not None:
             return default
         print(f"Warning: Failed to load JSON from {file_path}: {e}")
-        return {}
+        return [] if items_path is not None else {}
 
 
 def safe_json_save(data: Any,
                   file_path: Union[str, Path],
                   encoding: str = 'utf-8',
-                  indent: int = 2,
+                  indent: Optional[int] = None,
                   ensure_dir: bool = True) -> bool:
     """
     Safely save data to JSON file with error handling.
@@ -48,7 +253,8 @@ def safe_json_save(data: Any,
         data: Data to save
         file_path: Path to save file
         encoding: File encoding
-        indent: JSON indentation
+        indent: JSON indentation for human-readable output; None writes
+            compact JSON
         ensure_dir: Whether to create parent directories
         
     Returns:
@@ -57,12 +263,11 @@ def safe_json_save(data: Any,
     try:
         file_path = Path(file_path)
         
-        if ensure_dir:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(file_path, 'w', encoding=encoding) as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        payload = _dumps(data, indent)
+        if not _is_utf8(encoding):
+            payload = payload.decode('utf-8').encode(encoding)
         
+        _write_into(file_path, lambda: file_path.write_bytes(payload), ensure_dir)
         return True
         
     except (IOError, TypeError) as e:
@@ -87,6 +292,7 @@ def ensure_directory(dir_path: Union[str, Path],
         
         if dir_path.exists():
             if dir_path.is_dir():
+                _ENSURED_DIRS.add(os.path.abspath(dir_path))
                 return True
             else:
                 print(f"Warning: {dir_path} exists but is not a directory")
@@ -94,6 +300,7 @@ def ensure_directory(dir_path: Union[str, Path],
         
         if create_if_missing:
             dir_path.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(os.path.abspath(dir_path))
             return True
         
         return False
@@ -111,24 +318,45 @@ def find_files_by_pattern(directory: Union[str, Path],
     
     Args:
         directory: Directory to search
-        pattern: File pattern to match (e.g., "*.json")
+        pattern: File pattern to match (e.g., "*.json" or "sub/*.json")
         recursive: Whether to search recursively
         
     Returns:
         List of matching file paths
     """
-    try:
-        dir_path = Path(directory)
-        if not dir_path.exists() or not dir_path.is_dir():
-            return []
-        
-        if recursive:
-            return list(dir_path.rglob(pattern))
-        else:
-            return list(dir_path.glob(pattern))
-            
-    except (OSError, PermissionError):
+    if not os.path.isdir(directory):
         return []
+    
+    # Multi-component patterns need pathlib's glob semantics
+    separators = {'/', os.sep, os.altsep} - {None}
+    if '**' in pattern or any(sep in pattern for sep in separators):
+        try:
+            dir_path = Path(directory)
+            if recursive:
+                return list(dir_path.rglob(pattern))
+            return list(dir_path.glob(pattern))
+        except (OSError, PermissionError):
+            return []
+    
+    # Case-insensitive on Windows, like pathlib
+    pattern = os.path.normcase(pattern)
+    matches = []
+    stack = [os.fspath(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if fnmatch.fnmatchcase(os.path.normcase(entry.name), pattern):
+                        matches.append(Path(entry.path))
+                    # DirEntry caches the d_type, so this doesn't stat
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except (OSError, PermissionError):
+            # Skip unreadable directories, as rglob does
+            continue
+    
+    return matches
 
 
 def get_file_size(file_path: Union[str, Path]) -> Optional[int]:
@@ -161,14 +389,19 @@ def read_text_file(file_path: Union[str, Path],
     Returns:
         File contents or None if error
     """
+    try:
+        data = Path(file_path).read_bytes()
+    except (FileNotFoundError, IOError):
+        return None
+    
+    # Decode in memory so the fallback attempt doesn't re-read the file
     for enc in [encoding, fallback_encoding]:
         try:
-            with open(file_path, 'r', encoding=enc) as f:
-                return f.read()
+            text = data.decode(enc)
         except (UnicodeDecodeError, UnicodeError):
             continue
-        except (FileNotFoundError, IOError):
-            return None
+        # Match text-mode universal newline handling
+        return text.replace('\r\n', '\n').replace('\r', '\n')
     
     print(f"Warning: Failed to read {file_path} with encodings {encoding}, {fallback_encoding}")
     return None
@@ -193,12 +426,11 @@ def write_text_file(content: str,
     try:
         file_path = Path(file_path)
         
-        if ensure_dir:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(file_path, 'w', encoding=encoding) as f:
-            f.write(content)
+        def write():
+            with open(file_path, 'w', encoding=encoding) as f:
+                f.write(content)
         
+        _write_into(file_path, write, ensure_dir)
         return True
         
     except (IOError, UnicodeError) as e:
@@ -208,7 +440,8 @@ def write_text_file(content: str,
 
 def copy_file(source: Union[str, Path],
              destination: Union[str, Path],
-             overwrite: bool = False) -> bool:
+             overwrite: bool = False,
+             preserve_metadata: bool = False) -> bool:
     """
     Copy file from source to destination.
     
@@ -216,6 +449,7 @@ def copy_file(source: Union[str, Path],
         source: Source file path
         destination: Destination file path
         overwrite: Whether to overwrite existing file
+        preserve_metadata: Whether to also copy permissions and timestamps
         
     Returns:
         True if successful, False otherwise
@@ -234,10 +468,15 @@ def copy_file(source: Union[str, Path],
             print(f"Warning: Destination {destination} exists and overwrite=False")
             return False
         
-        # Ensure destination directory exists
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        # Copy into an existing directory like copy2 does
+        if dest_path.is_dir():
+            dest_path = dest_path / source_path.name
         
-        shutil.copy2(source_path, dest_path)
+        # Same copy of the contents either way; copy2 also copies metadata
+        copy = shutil.copy2 if preserve_metadata else shutil.copyfile
+        
+        # Creates the destination directory if needed
+        _write_into(dest_path, lambda: copy(source_path, dest_path))
         return True
         
     except (IOError, OSError) as e:
@@ -256,14 +495,15 @@ def get_project_root(marker_files: List[str] = None) -> Optional[Path]:
         Path to project root or None if not found
     """
     if marker_files is None:
-        marker_files = ['.git', 'pyproject.toml', 'setup.py', 'package.json', 'requirements.txt']
-    
-    current_path = Path.cwd()
+        marker_files = _DEFAULT_MARKERS
     
-    # Check current directory and parents
-    for path in [current_path] + list(current_path.parents):
+    # Walk up from the current directory, stopping at the first match
+    path = os.getcwd()
+    while True:
         for marker in marker_files:
-            if (path / marker).exists():
-                return path
-    
-    return None
\ No newline at end of file
+            if os.path.exists(os.path.join(path, marker)):
+                return Path(path)
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
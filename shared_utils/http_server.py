@@ -7,15 +7,28 @@ to eliminate duplication and provide reusable server components.
 """
 
 import http.server
-import socketserver
+import logging
+import os
+import signal
+import socket
+import sys
 import time
 import threading
 import webbrowser
 from typing import Optional, Callable
 
+_log = logging.getLogger(__name__)
+
 
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    """Enhanced HTTP request handler with CORS support and better logging."""
+    """
+    Enhanced HTTP request handler with CORS support and better logging.
+    
+    Requests are logged at INFO on the ``shared_utils.http_server`` logger.
+    CustomHTTPServer.start() enables that level and, if no handler is
+    configured anywhere, prints to stdout. Set the logger's level to
+    silence or filter request logs.
+    """
     
     def end_headers(self):
         """Add CORS headers to all responses."""
@@ -31,9 +44,27 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.end_headers()
     
     def log_message(self, format, *args):
-        """Custom logging format with timestamps."""
-        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-        print(f"{timestamp} - {self.address_string()} - {format % args}")
+        """Log requests through the module logger; formatting is deferred."""
+        _log.info("%s - " + format, self.address_string(), *args)
+
+
+class ThreadedHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded server that handles each request in its own daemon thread."""
+    
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ReusePortHTTPServer(ThreadedHTTPServer):
+    """Threaded server whose port can be shared by several worker processes."""
+    
+    # SO_REUSEPORT lets the kernel balance connections across workers
+    allow_reuse_port = True
+
+
+def _raise_system_exit(signum, frame):
+    """Signal handler turning SIGTERM into a normal interpreter exit."""
+    raise SystemExit(128 + signum)
 
 
 class CustomHTTPServer:
@@ -58,16 +89,19 @@ class CustomHTTPServer:
         self.handler_class = handler_class or CustomHTTPRequestHandler
         self.auto_open_browser = auto_open_browser
         self.httpd = None
+        self._worker_pids = []
     
     def start(self, 
              working_directory: Optional[str] = None,
-             service_name: str = "HTTP Server") -> bool:
+             service_name: str = "HTTP Server",
+             workers: int = 1) -> bool:
         """
         Start the HTTP server.
         
         Args:
             working_directory: Directory to serve files from
             service_name: Name of service for logging
+            workers: Number of processes sharing the port via SO_REUSEPORT
             
         Returns:
             True if server started successfully
@@ -75,28 +109,63 @@ class CustomHTTPServer:
         try:
             # Change working directory if specified
             if working_directory:
-                import os
                 os.chdir(working_directory)
             
-            # Create server
-            self.httpd = socketserver.TCPServer((self.host, self.port), self.handler_class)
-            
-            print(f'\n🚀 {service_name}')
-            print('=' * (len(service_name) + 3))
-            print(f'✅ Server running at: http://localhost:{self.port}')
-            if working_directory:
-                print(f'📂 Serving files from: {working_directory}')
-            print('\n💡 Press Ctrl+C to stop the server\n')
+            # Request logs are always shown, as with the previous print-based
+            # logging, unless this logger's level was set explicitly
+            if _log.level == logging.NOTSET:
+                _log.setLevel(logging.INFO)
+            if not _log.hasHandlers():
+                handler = logging.StreamHandler(sys.stdout)
+                handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s',
+                                                       datefmt='%Y-%m-%d %H:%M:%S'))
+                _log.addHandler(handler)
             
-            # Open browser in separate thread
-            if self.auto_open_browser:
-                browser_thread = threading.Thread(target=self._open_browser)
-                browser_thread.daemon = True
-                browser_thread.start()
+            # Create server
+            server_class = ThreadedHTTPServer
+            if workers > 1:
+                if (hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')
+                        and hasattr(http.server.HTTPServer, 'allow_reuse_port')):
+                    server_class = ReusePortHTTPServer
+                else:
+                    print('⚠️  Multiple workers need fork() and SO_REUSEPORT, using 1 worker.')
+                    workers = 1
+            self.httpd = server_class((self.host, self.port), self.handler_class)
             
-            # Start serving
-            self.httpd.serve_forever()
-            return True
+            previous_sigterm = None
+            try:
+                # Pre-fork extra workers, each with its own listening socket
+                parent_pid = os.getpid()
+                for _ in range(workers - 1):
+                    pid = os.fork()
+                    if pid == 0:
+                        self._run_worker(server_class, parent_pid)
+                    self._worker_pids.append(pid)
+                
+                # Make `kill`/supervisor shutdowns reap the workers too
+                if self._worker_pids and threading.current_thread() is threading.main_thread():
+                    previous_sigterm = signal.signal(signal.SIGTERM, _raise_system_exit)
+                
+                print(f'\n🚀 {service_name}')
+                print('=' * (len(service_name) + 3))
+                print(f'✅ Server running at: http://localhost:{self.port}')
+                if working_directory:
+                    print(f'📂 Serving files from: {working_directory}')
+                print('\n💡 Press Ctrl+C to stop the server\n')
+                
+                # Open browser in separate thread
+                if self.auto_open_browser:
+                    browser_thread = threading.Thread(target=self._open_browser)
+                    browser_thread.daemon = True
+                    browser_thread.start()
+                
+                # Start serving
+                self.httpd.serve_forever()
+                return True
+            finally:
+                self._stop_workers()
+                if previous_sigterm is not None:
+                    signal.signal(signal.SIGTERM, previous_sigterm)
             
         except OSError as e:
             if e.errno == 48:  # Address already in use
@@ -116,8 +185,41 @@ class CustomHTTPServer:
             print('\n👋 Shutting down server...')
             self.httpd.shutdown()
             self.httpd.server_close()
+            self._stop_workers()
             print('✅ Server stopped.')
     
+    def _run_worker(self, server_class: type, parent_pid: int):
+        """Serve requests in a forked worker process; never returns."""
+        address = self.httpd.server_address
+        self.httpd.server_close()
+        self._worker_pids = []
+        try:
+            self.httpd = server_class(address, self.handler_class)
+            watcher = threading.Thread(target=self._watch_parent, args=(parent_pid,))
+            watcher.daemon = True
+            watcher.start()
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os._exit(0)
+    
+    def _watch_parent(self, parent_pid: int):
+        """Shut a worker down once its parent process has gone away."""
+        while os.getppid() == parent_pid:
+            time.sleep(1)
+        self.httpd.shutdown()
+    
+    def _stop_workers(self):
+        """Terminate and reap forked worker processes."""
+        for pid in self._worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        self._worker_pids = []
+    
     def _open_browser(self):
         """Open default browser after short delay."""
         time.sleep(1)
@@ -8,25 +8,72 @@ to eliminate duplication and ensure consistency.
 
 import re
 import string
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Iterable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Patterns are compiled once at import time and shared by all instances
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]+", 
+    flags=re.UNICODE
+)
+_HTML_RE = re.compile(r'<[^>]+>')
+_URL_RE = re.compile(r'https?://[^\s"\'<>{}|]+')
+_WS_RE = re.compile(r'\s+')
+_ALLCAPS_RE = re.compile(r'\b[A-Z]{3,}\b')
+_NUM_RE = re.compile(r'\d+')
+_PCT_RE = re.compile(r'\d+%')
+_PRICE_RE = re.compile(r'\$\d+')
+
+_CTA_FUSED = re.compile(
+    r'\b(?:shop|buy|get|try|learn|discover|sign up|download'
+    r'|now|today|click|tap|visit)\b',
+    re.IGNORECASE
+)
+_CTA_PHRASES = re.compile(
+    r'\b(?:shop now|buy today|get started|learn more|sign up|download'
+    r'|click here|tap to|visit us|try free|order now'
+    r'|limited time|act now|don\'t miss|hurry up)\b',
+    re.IGNORECASE
+)
+_POS_FUSED = re.compile(
+    r'\b(?:amazing|awesome|great|excellent|perfect|love|best'
+    r'|incredible|fantastic|wonderful|outstanding|brilliant)\b',
+    re.IGNORECASE
+)
+_NEG_FUSED = re.compile(
+    r'\b(?:terrible|awful|worst|hate|horrible|bad'
+    r'|disappointing|frustrating|annoying|poor)\b',
+    re.IGNORECASE
+)
+_URG_FUSED = re.compile(
+    r'\b(?:urgent|immediate|asap|quickly|fast|rapid'
+    r'|deadline|expires|limited|ending|final)\b',
+    re.IGNORECASE
+)
+
+# Non-blank runs between periods, matching the sentence_count definition
+_SENTENCE_RE = re.compile(r'[^.]*?[^.\s][^.]*')
+
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_STOPWORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
 
 
 class TextProcessor:
     """Shared text processing and normalization utilities."""
     
-    def __init__(self):
-        self.emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"
-            "\U000024C2-\U0001F251"
-            "]+", 
-            flags=re.UNICODE
-        )
-        
+    emoji_pattern = _EMOJI_RE
+    
     def clean_text(self, text: str, remove_emojis: bool = False) -> str:
         """
         Clean and normalize text for analysis.
@@ -42,17 +89,17 @@ class TextProcessor:
             return ""
             
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_RE.sub('', text)
         
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        text = _URL_RE.sub('', text)
         
         # Remove emojis if requested
         if remove_emojis:
             text = self.emoji_pattern.sub('', text)
             
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         text = text.strip()
         
         return text
@@ -68,36 +115,74 @@ class TextProcessor:
             Dictionary of extracted features
         """
         features = {}
+        n = len(text)
+        
+        # Single C-level pass over the characters
+        char_counts = Counter(text)
         
         # Basic metrics
         features['word_count'] = len(text.split())
-        features['char_count'] = len(text)
+        features['char_count'] = n
         features['sentence_count'] = len([s for s in text.split('.') if s.strip()])
         
         # Capitalization patterns
-        features['all_caps_words'] = len(re.findall(r'\b[A-Z]{3,}\b', text))
-        features['caps_ratio'] = sum(1 for c in text if c.isupper()) / len(text) if text else 0
+        features['all_caps_words'] = len(_ALLCAPS_RE.findall(text))
+        features['caps_ratio'] = (sum(v for k, v in char_counts.items() if k.isupper()) / n
+                                  if n else 0)
         
         # Punctuation analysis
-        features['exclamation_count'] = text.count('!')
-        features['question_count'] = text.count('?')
+        features['exclamation_count'] = char_counts.get('!', 0)
+        features['question_count'] = char_counts.get('?', 0)
         features['emoji_count'] = len(self.emoji_pattern.findall(text))
         
         # Numeric content
-        features['number_count'] = len(re.findall(r'\d+', text))
-        features['percentage_mentions'] = len(re.findall(r'\d+%', text))
-        features['price_mentions'] = len(re.findall(r'\$\d+', text))
+        features['number_count'] = len(_NUM_RE.findall(text))
+        features['percentage_mentions'] = len(_PCT_RE.findall(text))
+        features['price_mentions'] = len(_PRICE_RE.findall(text))
         
         # Call-to-action indicators
-        cta_patterns = [
-            r'\b(shop|buy|get|try|learn|discover|sign up|download)\b',
-            r'\b(now|today|click|tap|visit)\b'
-        ]
-        features['cta_signals'] = sum(len(re.findall(pattern, text, re.IGNORECASE)) 
-                                    for pattern in cta_patterns)
+        features['cta_signals'] = len(_CTA_FUSED.findall(text))
         
         return features
     
+    def extract_features_batch(self, texts: Iterable[str]) -> 'pd.DataFrame':
+        """
+        Extract linguistic features from many texts at once.
+        
+        Produces the same features as extract_features, one row per text,
+        using vectorised pandas string operations. Requires pandas.
+        
+        Args:
+            texts: Cleaned texts (a list or pandas Series)
+            
+        Returns:
+            DataFrame with one column per feature
+        """
+        import pandas as pd
+        
+        s = pd.Series(texts, dtype=object)
+        
+        def count(pattern):
+            return s.str.count(pattern.pattern, flags=pattern.flags)
+        
+        char_count = s.str.len()
+        upper_count = s.map(lambda t: sum(map(str.isupper, t)))
+        
+        return pd.DataFrame({
+            'word_count': s.str.split().str.len(),
+            'char_count': char_count,
+            'sentence_count': count(_SENTENCE_RE),
+            'all_caps_words': count(_ALLCAPS_RE),
+            'caps_ratio': (upper_count / char_count).where(char_count > 0, 0),
+            'exclamation_count': s.str.count('!'),
+            'question_count': s.str.count(r'\?'),
+            'emoji_count': count(self.emoji_pattern),
+            'number_count': count(_NUM_RE),
+            'percentage_mentions': count(_PCT_RE),
+            'price_mentions': count(_PRICE_RE),
+            'cta_signals': count(_CTA_FUSED),
+        })
+    
     def extract_buzzwords(self, text: str, min_length: int = 3) -> List[str]:
         """
         Extract potential buzzwords from text.
@@ -110,15 +195,11 @@ class TextProcessor:
             List of potential buzzwords
         """
         # Remove punctuation and convert to lowercase
-        clean_text = text.translate(str.maketrans('', '', string.punctuation)).lower()
-        words = clean_text.split()
-        
-        # Filter by length and remove common words
-        common_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        buzzwords = [word for word in words 
-                    if len(word) >= min_length and word not in common_words]
+        words = text.translate(_PUNCT_TABLE).lower().split()
         
-        return list(set(buzzwords))  # Remove duplicates
+        # Filter by length, remove common words and duplicates in one pass
+        return list({word for word in words 
+                     if len(word) >= min_length and word not in _STOPWORDS})
     
     def extract_cta_text(self, text: str) -> List[str]:
         """
@@ -128,20 +209,9 @@ class TextProcessor:
             text: Text to analyze
             
         Returns:
-            List of CTA phrases found
+            List of CTA phrases found, in order of appearance
         """
-        cta_patterns = [
-            r'\b(shop now|buy today|get started|learn more|sign up|download)\b',
-            r'\b(click here|tap to|visit us|try free|order now)\b',
-            r'\b(limited time|act now|don\'t miss|hurry up)\b'
-        ]
-        
-        ctas = []
-        for pattern in cta_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            ctas.extend(matches)
-        
-        return ctas
+        return _CTA_PHRASES.findall(text)
     
     def analyze_sentiment_indicators(self, text: str) -> Dict[str, int]:
         """
@@ -153,39 +223,28 @@ class TextProcessor:
         Returns:
             Dictionary with sentiment indicator counts
         """
-        positive_patterns = [
-            r'\b(amazing|awesome|great|excellent|perfect|love|best)\b',
-            r'\b(incredible|fantastic|wonderful|outstanding|brilliant)\b'
-        ]
-        
-        negative_patterns = [
-            r'\b(terrible|awful|worst|hate|horrible|bad)\b',
-            r'\b(disappointing|frustrating|annoying|poor)\b'
-        ]
-        
-        urgency_patterns = [
-            r'\b(urgent|immediate|asap|quickly|fast|rapid)\b',
-            r'\b(deadline|expires|limited|ending|final)\b'
-        ]
-        
         return {
-            'positive_count': sum(len(re.findall(pattern, text, re.IGNORECASE)) 
-                                for pattern in positive_patterns),
-            'negative_count': sum(len(re.findall(pattern, text, re.IGNORECASE)) 
-                                for pattern in negative_patterns),
-            'urgency_count': sum(len(re.findall(pattern, text, re.IGNORECASE)) 
-                               for pattern in urgency_patterns)
+            'positive_count': len(_POS_FUSED.findall(text)),
+            'negative_count': len(_NEG_FUSED.findall(text)),
+            'urgency_count': len(_URG_FUSED.findall(text))
         }
 
 
+# Shared instance used by the convenience functions
+_DEFAULT_PROCESSOR = TextProcessor()
+
+
 # Convenience functions for backward compatibility
 def clean_text(text: str, remove_emojis: bool = False) -> str:
     """Convenience function for text cleaning."""
-    processor = TextProcessor()
-    return processor.clean_text(text, remove_emojis)
+    return _DEFAULT_PROCESSOR.clean_text(text, remove_emojis)
 
 
 def extract_features(text: str) -> Dict[str, Any]:
     """Convenience function for feature extraction."""
-    processor = TextProcessor()
-    return processor.extract_features(text)
\ No newline at end of file
+    return _DEFAULT_PROCESSOR.extract_features(text)
+
+
+def extract_features_batch(texts: Iterable[str]) -> 'pd.DataFrame':
+    """Convenience function for batch feature extraction."""
+    return _DEFAULT_PROCESSOR.extract_features_batch(texts)
\ No newline at end of file